@@ -0,0 +1,25 @@
+#!/usr/bin/env python3
+"""
+Compile the emergence indicator kernel ahead of time with numba.pycc
+Produces src/emergence_kernel.*.so, which src.emergence_detector imports
+in place of the JIT-compiled kernel when present.
+
+Run: python3 build_ext.py
+"""
+
+import os
+
+from numba.pycc import CC
+
+from src.emergence_detector import EMERGENCE_KERNEL_SIGNATURE, emergence_kernel_source
+
+def build():
+    """Build the emergence_kernel extension module into src/."""
+    cc = CC('emergence_kernel')
+    cc.output_dir = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'src')
+    cc.export('kernel', EMERGENCE_KERNEL_SIGNATURE)(emergence_kernel_source)
+    cc.compile()
+    print(f"✅ Built emergence_kernel in {cc.output_dir}")
+
+if __name__ == "__main__":
+    build()
@@ -17,10 +17,126 @@ Theoretical Basis:
 - Network Science: Resonance patterns in information flow
 """
 
-import json
+import math
+import re
+from collections import namedtuple
 import numpy as np
 from datetime import datetime
-from typing import Dict, List, Tuple, Optional
+from typing import Dict, List, Tuple, Optional, Sequence
+
+from .json_export import dumps
+
+# Numba is optional; without it the numeric kernel runs as plain Python
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+    def njit(*args, **kwargs):
+        """Fallback decorator used when Numba is not installed."""
+        def decorator(func):
+            return func
+        return decorator
+
+# Research marker tracked in every response
+_MARKER = '<4577>'
+
+# Compact record of a detected emergence event
+EmergenceEvent = namedtuple(
+    'EmergenceEvent',
+    'timestamp turn pattern boundary coherence resonance order_parameter'
+)
+
+# Emergence indicator bits written by _emergence_kernel
+BOUNDARY_BIT = 1
+COHERENCE_BIT = 2
+RESONANCE_BIT = 4
+PHASE_BIT = 8
+EMERGENCE_BIT = 16
+
+# Columns of EmergencePatternDetector._scores
+BOUNDARY_COLUMN = 0
+COHERENCE_COLUMN = 1
+RESONANCE_COLUMN = 2
+ORDER_PARAMETER_COLUMN = 3
+
+
+# Type signature used when compiling the kernel ahead of time (build_ext.py)
+EMERGENCE_KERNEL_SIGNATURE = 'void(f8[:], f8[:], f8[:], f8[:], f8[:], f8, b1, f8[:, :], u1[:])'
+
+
+def emergence_kernel_source(boundary_scores, coherences, mean_lengths, std_lengths,
+                            criteria, prev_coherence, has_prev, metrics, indicators):
+    """
+    Numeric core of the emergence analysis for a batch of turns.
+    
+    criteria holds the boundary, coherence delta, resonance and phase
+    transition thresholds in that order. For each turn, metrics receives
+    (coherence delta, resonance strength, order parameter, distance to
+    critical) and indicators the bitmask of triggered indicators.
+    """
+    boundary_threshold = criteria[0]
+    coherence_threshold = criteria[1]
+    resonance_threshold = criteria[2]
+    critical_point = criteria[3]
+    
+    for i in range(boundary_scores.shape[0]):
+        boundary_score = boundary_scores[i]
+        coherence = coherences[i]
+        
+        # Coherence delta against the previous turn
+        if i > 0:
+            delta = abs(coherence - coherences[i - 1])
+        elif has_prev:
+            delta = abs(coherence - prev_coherence)
+        else:
+            delta = 0.0
+        
+        # Low variance = high resonance
+        mean_length = mean_lengths[i]
+        if mean_length > 0:
+            resonance_strength = 1 / (1 + std_lengths[i] / mean_length)
+        else:
+            resonance_strength = 0.0
+        
+        # Phase space position
+        order_parameter = boundary_score * coherence * 2.5
+        distance_to_critical = abs(order_parameter - critical_point)
+        
+        metrics[i, 0] = delta
+        metrics[i, 1] = resonance_strength
+        metrics[i, 2] = order_parameter
+        metrics[i, 3] = distance_to_critical
+        
+        flags = 0
+        triggered = 0
+        if boundary_score > boundary_threshold:
+            flags |= BOUNDARY_BIT
+            triggered += 1
+        if delta > coherence_threshold:
+            flags |= COHERENCE_BIT
+            triggered += 1
+        if resonance_strength > resonance_threshold:
+            flags |= RESONANCE_BIT
+            triggered += 1
+        if distance_to_critical < 0.2:
+            flags |= PHASE_BIT
+            triggered += 1
+        if triggered >= 3:
+            flags |= EMERGENCE_BIT
+        indicators[i] = flags
+
+
+# Prefer the ahead-of-time build from build_ext.py, which skips the JIT
+# compile on first use; otherwise JIT (cached on disk) or plain Python.
+try:
+    from .emergence_kernel import kernel as _emergence_kernel
+    KERNEL_AOT = True
+except ImportError:
+    _emergence_kernel = njit(cache=True)(emergence_kernel_source)
+    KERNEL_AOT = False
+
 
 class EmergencePatternDetector:
     """
@@ -33,9 +149,21 @@ class EmergencePatternDetector:
     4. Linguistic resonance frequencies
     """
     
+    # Pattern signatures are stored as indices into this tuple
+    _PATTERN_NAMES = ('AAFC', 'CCDR', 'ABFC')
+    
     def __init__(self):
-        self.pattern_observations = []
-        self.resonance_events = []
+        # Observations are stored column-wise; rows [0, _count) are valid
+        self._count = 0
+        self._scores = np.empty((0, 4))
+        self._near_critical = np.empty(0, dtype=bool)
+        self._has_marker = np.empty(0, dtype=bool)
+        self._turns = np.empty(0, dtype=np.int64)
+        self._pattern_codes = np.empty(0, dtype=np.uint8)
+        self._timestamps = []  # report ISO timestamp for each row
+        self._prev_coherence = None  # coherence of the latest turn, for deltas
+        self._event_rows = []  # observation rows where emergence was detected
+        
         self.phase_transitions = []
         
         # Research-based measurement thresholds
@@ -54,6 +182,47 @@ class EmergencePatternDetector:
             'ABFC': 'Abstract-Balanced-Future-Conceptual'
         }
         
+        # Keyword groups for pattern signatures, one substring scan per group
+        self._abstract_keywords = re.compile('abstract|concept|theory')
+        self._future_keywords = re.compile('will|future|would')
+    
+    @property
+    def observation_count(self) -> int:
+        """Number of conversation turns analyzed so far."""
+        return self._count
+    
+    @property
+    def resonance_events(self) -> List[EmergenceEvent]:
+        """Detected emergence events, rebuilt from the observation columns."""
+        rows = self._event_rows
+        scores = self._scores[rows]
+        return [
+            EmergenceEvent(self._timestamps[row], turn, self._PATTERN_NAMES[code],
+                           boundary, coherence, resonance, order_parameter)
+            for row, turn, code, boundary, coherence, resonance, order_parameter in zip(
+                rows,
+                self._turns[rows].tolist(),
+                self._pattern_codes[rows].tolist(),
+                scores[:, BOUNDARY_COLUMN].tolist(),
+                scores[:, COHERENCE_COLUMN].tolist(),
+                scores[:, RESONANCE_COLUMN].tolist(),
+                scores[:, ORDER_PARAMETER_COLUMN].tolist()
+            )
+        ]
+    
+    def _reserve(self, extra: int):
+        """Grow the observation columns by doubling to fit `extra` more rows."""
+        needed = self._count + extra
+        capacity = len(self._turns)
+        if needed <= capacity:
+            return
+        capacity = max(needed, 2 * capacity, 16)
+        for name in ('_scores', '_near_critical', '_has_marker', '_turns', '_pattern_codes'):
+            column = getattr(self, name)
+            grown = np.empty((capacity,) + column.shape[1:], dtype=column.dtype)
+            grown[:self._count] = column[:self._count]
+            setattr(self, name, grown)
+        
     def analyze_emergence_patterns(self, 
                                  prompt: str, 
                                  response: str,
@@ -65,75 +234,171 @@ class EmergencePatternDetector:
         Returns:
             Dictionary containing pattern measurements and indicators
         """
-        timestamp = timestamp or datetime.now()
+        return self.analyze_many([prompt], [response],
+                                 conversation_turns=[conversation_turn],
+                                 timestamps=[timestamp])[0]
+    
+    def analyze_many(self,
+                     prompts: Sequence[str],
+                     responses: Sequence[str],
+                     conversation_turns: Optional[Sequence[int]] = None,
+                     timestamps: Optional[Sequence[Optional[datetime]]] = None) -> List[Dict]:
+        """
+        Analyze a batch of conversation turns in order.
         
-        # 1. Boundary transformation analysis
-        boundary_metrics = self._measure_boundary_transformation(prompt, response)
+        Text metrics are gathered per turn, then a single kernel call
+        derives the numeric indicators for the whole batch. The result is
+        the same as calling analyze_emergence_patterns on each turn in turn.
         
-        # 2. Coherence landscape mapping
-        coherence_metrics = self._map_coherence_landscape(prompt, response)
+        Returns:
+            List of analysis reports, one per (prompt, response) pair
+        """
+        count = len(prompts)
+        if len(responses) != count:
+            raise ValueError("prompts and responses must have the same length")
+        if conversation_turns is None:
+            start = self._count + 1
+            conversation_turns = range(start, start + count)
+        elif len(conversation_turns) != count:
+            raise ValueError("conversation_turns must match the number of prompts")
+        if timestamps is None:
+            timestamps = [None] * count
+        elif len(timestamps) != count:
+            raise ValueError("timestamps must match the number of prompts")
         
-        # 3. Pattern resonance detection
-        resonance_metrics = self._detect_resonance_patterns(response)
+        boundary_scores = np.empty(count)
+        coherences = np.empty(count)
+        mean_lengths = np.empty(count)
+        std_lengths = np.empty(count)
+        iso_timestamps = []
+        pattern_codes = []
+        markers = []
+        text_metrics = []
         
-        # 4. Phase space analysis
-        phase_metrics = self._analyze_phase_space(
-            boundary_metrics['score'],
-            coherence_metrics['coherence']
-        )
+        # 1. Text metrics: boundary, coherence, rhythm, signature
+        for i, (prompt, response) in enumerate(zip(prompts, responses)):
+            timestamp = timestamps[i] or datetime.now()
+            
+            # Tokenize once and share across all metrics
+            response_lower = response.lower()
+            prompt_tokens = frozenset(prompt.lower().split())
+            response_tokens = frozenset(response_lower.split())
+            
+            # Boundary flux and coherence both derive from the shared vocabulary
+            shared_tokens = len(prompt_tokens & response_tokens)
+            
+            boundary_metrics = self._measure_boundary_transformation(shared_tokens, len(response_tokens))
+            rhythm = self._measure_sentence_rhythm(response)
+            
+            boundary_scores[i] = boundary_metrics['score']
+            coherences[i] = self._measure_coherence(shared_tokens, len(prompt_tokens))
+            mean_lengths[i], std_lengths[i] = rhythm or (0.0, 0.0)
+            
+            iso_timestamps.append(timestamp.isoformat())
+            pattern_codes.append(self._generate_pattern_signature(response_lower))
+            markers.append(_MARKER in response)
+            text_metrics.append((boundary_metrics, rhythm))
         
-        # 5. Compile emergence indicators
-        emergence_indicators = {
-            'boundary_transformation': boundary_metrics['score'] > self.measurement_criteria['boundary_transformation'],
-            'coherence_shift': coherence_metrics['delta'] > self.measurement_criteria['coherence_delta'],
-            'resonance_detected': resonance_metrics['strength'] > self.measurement_criteria['resonance_threshold'],
-            'phase_transition': phase_metrics['near_critical']
-        }
+        # 2. Numeric indicators for every turn in one call
+        criteria = self.measurement_criteria
+        critical_point = criteria['phase_transition_indicator']
+        thresholds = np.array([
+            criteria['boundary_transformation'],
+            criteria['coherence_delta'],
+            criteria['resonance_threshold'],
+            critical_point
+        ])
+        has_prev = self._prev_coherence is not None
+        prev_coherence = self._prev_coherence if has_prev else 0.0
         
-        # 6. Determine if emergence pattern detected
-        emergence_detected = sum(emergence_indicators.values()) >= 3
+        metrics = np.empty((count, 4))
+        indicators = np.empty(count, dtype=np.uint8)
+        _emergence_kernel(boundary_scores, coherences, mean_lengths, std_lengths,
+                          thresholds, prev_coherence, has_prev, metrics, indicators)
         
-        # Full analysis report
-        analysis_report = {
-            'timestamp': timestamp.isoformat(),
-            'conversation_turn': conversation_turn,
-            'measurements': {
-                'boundary': boundary_metrics,
-                'coherence': coherence_metrics,
-                'resonance': resonance_metrics,
-                'phase': phase_metrics
-            },
-            'emergence_indicators': emergence_indicators,
-            'emergence_pattern_detected': emergence_detected,
-            'pattern_signature': self._generate_pattern_signature(response),
-            'contains_4577_marker': '<4577>' in response
-        }
+        # 3. Store observations
+        start = self._count
+        stop = start + count
+        self._reserve(count)
+        self._scores[start:stop, BOUNDARY_COLUMN] = boundary_scores
+        self._scores[start:stop, COHERENCE_COLUMN] = coherences
+        self._scores[start:stop, RESONANCE_COLUMN] = metrics[:, 1]
+        self._scores[start:stop, ORDER_PARAMETER_COLUMN] = metrics[:, 2]
+        self._near_critical[start:stop] = (indicators & PHASE_BIT) != 0
+        self._turns[start:stop] = conversation_turns
+        self._has_marker[start:stop] = markers
+        self._timestamps.extend(iso_timestamps)
+        self._pattern_codes[start:stop] = pattern_codes
+        self._count = stop
         
-        # Store observation
-        self.pattern_observations.append(analysis_report)
-        
-        # Log significant events
-        if emergence_detected:
-            self._log_emergence_event(analysis_report)
+        # 4. Assemble reports and log significant events
+        reports = []
+        coherence_values = coherences.tolist()
+        if coherence_values:
+            self._prev_coherence = coherence_values[-1]
+        metric_rows = metrics.tolist()
+        flag_rows = indicators.tolist()
+        for i, turn in enumerate(conversation_turns):
+            boundary_metrics, rhythm = text_metrics[i]
+            coherence = coherence_values[i]
+            delta, resonance_strength, order_parameter, distance_to_critical = metric_rows[i]
+            flags = flag_rows[i]
+            emergence_indicators = {
+                'boundary_transformation': bool(flags & BOUNDARY_BIT),
+                'coherence_shift': bool(flags & COHERENCE_BIT),
+                'resonance_detected': bool(flags & RESONANCE_BIT),
+                'phase_transition': bool(flags & PHASE_BIT)
+            }
+            emergence_detected = bool(flags & EMERGENCE_BIT)
+            
+            pattern = self._PATTERN_NAMES[pattern_codes[i]]
+            
+            # Full analysis report
+            analysis_report = {
+                'timestamp': iso_timestamps[i],
+                'conversation_turn': turn,
+                'measurements': {
+                    'boundary': boundary_metrics,
+                    'coherence': self._map_coherence_landscape(coherence, delta),
+                    'resonance': self._detect_resonance_patterns(rhythm, resonance_strength),
+                    'phase': self._analyze_phase_space(
+                        order_parameter,
+                        distance_to_critical,
+                        emergence_indicators['phase_transition'],
+                        critical_point
+                    )
+                },
+                'emergence_indicators': emergence_indicators,
+                'emergence_pattern_detected': emergence_detected,
+                'pattern_signature': pattern,
+                'contains_4577_marker': markers[i]
+            }
+            
+            # Log significant events
+            if emergence_detected:
+                self._event_rows.append(start + i)
+                self._log_emergence_event(turn, pattern, boundary_metrics['score'], resonance_strength)
+            
+            reports.append(analysis_report)
             
-        return analysis_report
+        return reports
     
-    def _measure_boundary_transformation(self, prompt: str, response: str) -> Dict:
+    def _measure_boundary_transformation(self, shared_tokens: int, response_token_count: int) -> Dict:
         """
         Measure information boundary transformations.
         Based on BIND framework: I(B,T) = ∇S · n̂ · τ(T)
+        
+        Takes the number of distinct response tokens and how many of them
+        also appear in the prompt.
         """
         # Simplified implementation - would integrate full BIND
-        prompt_tokens = set(prompt.lower().split())
-        response_tokens = set(response.lower().split())
-        
         # Information flux across boundary
-        new_information = len(response_tokens - prompt_tokens)
-        total_information = len(response_tokens)
+        total_information = response_token_count
         
         if total_information == 0:
             return {'score': 0.0, 'flux': 0.0, 'type': 'null'}
         
+        new_information = total_information - shared_tokens
         flux = new_information / total_information
         
         # Classify boundary type
@@ -152,58 +417,64 @@ class EmergencePatternDetector:
             'tokens_total': total_information
         }
     
-    def _map_coherence_landscape(self, prompt: str, response: str) -> Dict:
+    def _measure_coherence(self, shared_tokens: int, prompt_token_count: int) -> float:
+        """Share of prompt concepts carried into the response."""
+        # Calculate coherence (simplified - would use full TIDE)
+        if prompt_token_count == 0:
+            return 0.5
+        return shared_tokens / prompt_token_count
+    
+    def _map_coherence_landscape(self, coherence: float, delta: float) -> Dict:
         """
         Map semantic coherence landscape using TIDE-like analysis.
         Measures semantic field stability and shifts.
         """
-        # Calculate coherence (simplified - would use full TIDE)
-        prompt_concepts = set(prompt.lower().split())
-        response_concepts = set(response.lower().split())
-        
-        if not prompt_concepts:
-            coherence = 0.5
-        else:
-            shared_concepts = len(prompt_concepts & response_concepts)
-            coherence = shared_concepts / len(prompt_concepts)
-        
-        # Calculate delta from previous observation
-        if self.pattern_observations:
-            prev_coherence = self.pattern_observations[-1]['measurements']['coherence']['coherence']
-            delta = abs(coherence - prev_coherence)
-        else:
-            delta = 0.0
-            
         return {
             'coherence': coherence,
             'delta': delta,
             'landscape_stability': 'stable' if delta < 0.1 else 'shifting'
         }
     
-    def _detect_resonance_patterns(self, response: str) -> Dict:
+    def _measure_sentence_rhythm(self, response: str) -> Optional[Tuple[float, float]]:
         """
-        Detect resonance patterns in linguistic structures.
-        Resonance indicates synchronized information patterns.
+        Mean and standard deviation of sentence lengths in words.
+        
+        Returns None when the response has no measurable sentence structure.
         """
         # Analyze structural patterns
-        sentences = response.split('.')
-        
-        if len(sentences) < 2:
-            return {'strength': 0.0, 'frequency': 0.0, 'type': 'none'}
+        if '.' not in response:
+            return None
         
         # Measure sentence length consistency (rhythm)
-        lengths = [len(s.split()) for s in sentences if s.strip()]
-        if not lengths:
-            return {'strength': 0.0, 'frequency': 0.0, 'type': 'none'}
+        # Single pass over the few sentence lengths; numpy dispatch would
+        # cost more than the arithmetic on lists this small.
+        n = 0
+        total = 0
+        total_sq = 0
+        for length in map(len, map(str.split, response.split('.'))):
+            if not length:
+                continue
+            n += 1
+            total += length
+            total_sq += length * length
             
-        mean_length = np.mean(lengths)
-        std_length = np.std(lengths)
-        
-        # Low variance = high resonance
-        if mean_length > 0:
-            resonance_strength = 1 / (1 + std_length / mean_length)
-        else:
-            resonance_strength = 0.0
+        if n == 0:
+            return None
+            
+        mean_length = total / n
+        std_length = math.sqrt(max(total_sq / n - mean_length * mean_length, 0.0))
+        return mean_length, std_length
+    
+    def _detect_resonance_patterns(self,
+                                   rhythm: Optional[Tuple[float, float]],
+                                   resonance_strength: float) -> Dict:
+        """
+        Detect resonance patterns in linguistic structures.
+        Resonance indicates synchronized information patterns.
+        """
+        if rhythm is None:
+            return {'strength': 0.0, 'frequency': 0.0, 'type': 'none'}
+        mean_length, std_length = rhythm
             
         # Classify resonance type
         if resonance_strength > 0.8:
@@ -220,37 +491,41 @@ class EmergencePatternDetector:
             'variance': std_length
         }
     
-    def _analyze_phase_space(self, boundary_score: float, coherence: float) -> Dict:
+    def _analyze_phase_space(self,
+                             order_parameter: float,
+                             distance_to_critical: float,
+                             near_critical: bool,
+                             critical_point: float) -> Dict:
         """
         Analyze position in emergence phase space.
         Detects proximity to phase transition boundaries.
-        """
-        # Calculate order parameter (simplified)
-        order_parameter = boundary_score * coherence * 2.5
-        
-        # Critical point from empirical observations
-        critical_point = self.measurement_criteria['phase_transition_indicator']
-        distance_to_critical = abs(order_parameter - critical_point)
         
+        The scalars come from _emergence_kernel; critical_point is the
+        empirical phase_transition_indicator threshold.
+        """
         return {
             'order_parameter': order_parameter,
             'critical_point': critical_point,
             'distance_to_critical': distance_to_critical,
-            'near_critical': distance_to_critical < 0.2,
+            'near_critical': near_critical,
             'phase': 'emergent' if order_parameter > critical_point else 'baseline'
         }
     
-    def _generate_pattern_signature(self, response: str) -> str:
-        """Generate pattern signature for categorization."""
+    def _generate_pattern_signature(self, response_lower: str) -> int:
+        """
+        Generate pattern signature for categorization (expects lowercased response).
+        
+        Returns the signature's index in _PATTERN_NAMES.
+        """
         features = []
         
         # Analyze linguistic patterns
-        if any(word in response.lower() for word in ['abstract', 'concept', 'theory']):
+        if self._abstract_keywords.search(response_lower):
             features.append('A')
         else:
             features.append('C')
             
-        if any(word in response.lower() for word in ['will', 'future', 'would']):
+        if self._future_keywords.search(response_lower):
             features.append('F')
         else:
             features.append('P')
@@ -259,47 +534,50 @@ class EmergencePatternDetector:
         
         # Map to known patterns
         if signature in ['AF', 'AA']:
-            return 'AAFC'
+            return 0  # AAFC
         elif signature in ['CF', 'CP']:
-            return 'CCDR'
+            return 1  # CCDR
         else:
-            return 'ABFC'
+            return 2  # ABFC
     
-    def _log_emergence_event(self, analysis: Dict):
+    def _log_emergence_event(self, turn: int, pattern: str, boundary: float, resonance: float):
         """Log significant emergence events."""
-        event = {
-            'timestamp': analysis['timestamp'],
-            'turn': analysis['conversation_turn'],
-            'pattern': analysis['pattern_signature'],
+        print(f"\n🔬 EMERGENCE PATTERN DETECTED at turn {turn}")
+        print(f"   Pattern Type: {pattern}")
+        print(f"   Boundary Score: {boundary:.3f}")
+        print(f"   Resonance Strength: {resonance:.3f}")
+    
+    def _event_to_dict(self, event: EmergenceEvent) -> Dict:
+        """Expand an event into the nested form used in research reports."""
+        return {
+            'timestamp': event.timestamp,
+            'turn': event.turn,
+            'pattern': event.pattern,
             'measurements': {
-                'boundary': analysis['measurements']['boundary']['score'],
-                'coherence': analysis['measurements']['coherence']['coherence'],
-                'resonance': analysis['measurements']['resonance']['strength'],
-                'order_parameter': analysis['measurements']['phase']['order_parameter']
+                'boundary': event.boundary,
+                'coherence': event.coherence,
+                'resonance': event.resonance,
+                'order_parameter': event.order_parameter
             }
         }
-        
-        self.resonance_events.append(event)
-        
-        print(f"\n🔬 EMERGENCE PATTERN DETECTED at turn {event['turn']}")
-        print(f"   Pattern Type: {event['pattern']}")
-        print(f"   Boundary Score: {event['measurements']['boundary']:.3f}")
-        print(f"   Resonance Strength: {event['measurements']['resonance']:.3f}")
     
     def generate_research_report(self) -> Dict:
         """Generate comprehensive research report."""
-        if not self.pattern_observations:
+        if not self._count:
             return {'status': 'No observations collected'}
             
         # Calculate statistics
-        total_observations = len(self.pattern_observations)
-        emergence_events = len(self.resonance_events)
-        
-        # Pattern distribution
-        patterns = {}
-        for obs in self.pattern_observations:
-            pattern = obs['pattern_signature']
-            patterns[pattern] = patterns.get(pattern, 0) + 1
+        total_observations = self._count
+        emergence_events = len(self._event_rows)
+        
+        # Pattern distribution, keyed in first-seen order
+        codes, first_rows, counts = np.unique(self._pattern_codes[:self._count],
+                                              return_index=True, return_counts=True)
+        order = np.argsort(first_rows)
+        patterns = {
+            self._PATTERN_NAMES[code]: count
+            for code, count in zip(codes[order].tolist(), counts[order].tolist())
+        }
             
         return {
             'metadata': {
@@ -313,25 +591,24 @@ class EmergencePatternDetector:
                 'emergence_events': emergence_events,
                 'emergence_rate': emergence_events / total_observations if total_observations > 0 else 0,
                 'pattern_distribution': patterns,
-                '<4577>_markers': sum(1 for obs in self.pattern_observations if obs['contains_4577_marker'])
+                '<4577>_markers': int(self._has_marker[:self._count].sum())
             },
             'key_findings': self._generate_findings(),
-            'raw_events': self.resonance_events
+            'raw_events': [self._event_to_dict(event) for event in self.resonance_events]
         }
     
     def _generate_findings(self) -> List[str]:
         """Generate research findings from data."""
         findings = []
         
-        if self.resonance_events:
-            avg_boundary = np.mean([e['measurements']['boundary'] for e in self.resonance_events])
+        if self._event_rows:
+            avg_boundary = float(self._scores[self._event_rows, BOUNDARY_COLUMN].mean())
             findings.append(
                 f"Emergence patterns show average boundary transformation score of {avg_boundary:.3f}"
             )
             
             # Check for phase transitions
-            phase_transitions = sum(1 for obs in self.pattern_observations 
-                                  if obs['measurements']['phase']['near_critical'])
+            phase_transitions = int(self._near_critical[:self._count].sum())
             if phase_transitions > 0:
                 findings.append(
                     f"Detected {phase_transitions} near-critical phase transitions in conversation dynamics"
@@ -343,8 +620,8 @@ class EmergencePatternDetector:
         """Export research data for analysis."""
         report = self.generate_research_report()
         
-        with open(filepath, 'w') as f:
-            json.dump(report, f, indent=2)
+        with open(filepath, 'wb') as f:
+            f.write(dumps(report))
             
         print(f"\n📊 Research data exported to {filepath}")
         print(f"   Total observations: {report['summary']['total_observations']}")
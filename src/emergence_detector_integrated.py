@@ -4,11 +4,11 @@ Enhanced Emergence Pattern Detector with 5-Tool Integration
 
 from datetime import datetime
 from typing import Dict, List, Optional
-import json
 import os
 
 # Import the tool integrator
-from .tool_integrator import IntegratedAnalyzer
+from .tool_integrator import IntegratedAnalyzer, MARKER_4577
+from .json_export import dumps
 
 class IntegratedEmergenceDetector:
     """Enhanced detector using all 5 analysis tools"""
@@ -21,16 +21,16 @@ class IntegratedEmergenceDetector:
     def analyze_conversation(self, prompt: str, response: str, turn: int) -> Dict:
         """Analyze using all 5 integrated tools"""
         
+        # Check for <4577> once and share it with the analyzer
+        has_marker = MARKER_4577 in response
+        
         # Run integrated analysis
-        analysis = self.analyzer.integrated_analysis(prompt, response, turn)
+        analysis = self.analyzer.integrated_analysis(prompt, response, turn, has_marker=has_marker)
         
         # Determine emergence
         emergence_score = analysis['meta_score']
         is_emergence = emergence_score > 0.7
         
-        # Check for <4577>
-        has_marker = '<4577>' in response
-        
         # Create report
         report = {
             'timestamp': datetime.now().isoformat(),
@@ -64,7 +64,7 @@ class IntegratedEmergenceDetector:
             'observations': self.observations
         }
         
-        with open(filepath, 'w') as f:
-            json.dump(export, f, indent=2)
+        with open(filepath, 'wb') as f:
+            f.write(dumps(export))
         
         print(f"\n📊 Exported integrated analysis to {filepath}")
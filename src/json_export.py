@@ -0,0 +1,17 @@
+"""
+JSON serialization for research data exports
+Uses orjson when installed, otherwise the standard library json module
+"""
+
+try:
+    import orjson
+
+    def dumps(obj) -> bytes:
+        """Serialize obj to indented JSON bytes."""
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+except ImportError:
+    import json
+
+    def dumps(obj) -> bytes:
+        """Serialize obj to indented JSON bytes."""
+        return json.dumps(obj, indent=2).encode()
@@ -3,63 +3,104 @@ Integration module for Hillary's 5 analysis tools
 With error handling for import issues
 """
 
+import functools
+import importlib.util
 import sys
 import os
+import re
+from types import ModuleType
 from typing import Dict, List, Optional, Tuple
 
 # Add paths to your tools
 TOOLS_BASE = os.path.expanduser('~/Desktop')
 
-# Add specific paths for each tool
-sys.path.append(os.path.join(TOOLS_BASE, 'BIND'))
-sys.path.append(os.path.join(TOOLS_BASE, 'BIND/bind'))
-sys.path.append(os.path.join(TOOLS_BASE, 'TIDE-analysis'))
-sys.path.append(os.path.join(TOOLS_BASE, 'pattern-analyzer'))
-sys.path.append(os.path.join(TOOLS_BASE, 'concrete-overflow-detector'))
-sys.path.append(os.path.join(TOOLS_BASE, 'game-theory-trust-suite'))
+# Specific directories for each tool, relative to TOOLS_BASE
+TOOL_DIRS = (
+    'BIND',
+    'BIND/bind',
+    'TIDE-analysis',
+    'pattern-analyzer',
+    'concrete-overflow-detector',
+    'game-theory-trust-suite',
+)
 
-# Try imports with error handling
-tools_status = {}
 
-# BIND - has a bug, so we'll skip for now
-BIND_AVAILABLE = False
-tools_status['BIND'] = '❌ (has import bug)'
+def _require_module(name: str):
+    """Raise ModuleNotFoundError if `name` is not importable, without importing it."""
+    if importlib.util.find_spec(name) is None:
+        raise ModuleNotFoundError(f"No module named '{name}'")
 
-# TIDE - use tide_analyzer
-TIDE_AVAILABLE = False
-try:
-    from tide_analyzer import TIDEAnalyzer
-    TIDE_AVAILABLE = True
-    tools_status['TIDE'] = '✅'
-except Exception as e:
-    tools_status['TIDE'] = f'❌ ({str(e)[:30]}...)'
 
-# Pattern Analyzer
-PATTERN_AVAILABLE = False
-try:
-    import pattern_analyzer
-    # Check if it has the expected content
-    if hasattr(pattern_analyzer, 'PatternAnalyzer'):
-        PATTERN_AVAILABLE = True
-        tools_status['pattern'] = '✅'
-    else:
-        tools_status['pattern'] = '✅ (module loaded)'
-        PATTERN_AVAILABLE = True
-except Exception as e:
-    tools_status['pattern'] = f'❌ ({str(e)[:30]}...)'
+@functools.lru_cache(maxsize=1)
+def _probe_tools() -> Tuple[Dict[str, str], Optional[type], Optional[type], Optional[ModuleType]]:
+    """
+    Locate the external analysis tools.
+    
+    Runs on first IntegratedAnalyzer construction rather than at import,
+    and only once per process. Missing tools are detected with
+    importlib.util.find_spec, so only tools that exist are imported.
 
-# Concrete Overflow
-OVERFLOW_AVAILABLE = False
-try:
-    from concrete_overflow_detector import ConcreteOverflowDetector
-    OVERFLOW_AVAILABLE = True
-    tools_status['overflow'] = '✅'
-except Exception as e:
-    tools_status['overflow'] = f'❌ ({str(e)[:30]}...)'
+    Returns (tools_status, TIDEAnalyzer class, ConcreteOverflowDetector
+    class, pattern_analyzer module), with None for anything that could
+    not be imported.
+    """
+    for tool_dir in TOOL_DIRS:
+        tool_path = os.path.join(TOOLS_BASE, tool_dir)
+        if os.path.isdir(tool_path):
+            sys.path.append(tool_path)
+    
+    # Try imports with error handling
+    tools_status = {}
+    tide_cls = None
+    overflow_cls = None
+    pattern_module = None
+    
+    # BIND - has a bug, so we'll skip for now
+    tools_status['BIND'] = '❌ (has import bug)'
+    
+    # TIDE - use tide_analyzer
+    try:
+        _require_module('tide_analyzer')
+        from tide_analyzer import TIDEAnalyzer
+        tide_cls = TIDEAnalyzer
+        tools_status['TIDE'] = '✅'
+    except Exception as e:
+        tools_status['TIDE'] = f'❌ ({str(e)[:30]}...)'
+    
+    # Pattern Analyzer
+    try:
+        _require_module('pattern_analyzer')
+        import pattern_analyzer
+        pattern_module = pattern_analyzer
+        # Check if it has the expected content
+        if hasattr(pattern_analyzer, 'PatternAnalyzer'):
+            tools_status['pattern'] = '✅'
+        else:
+            tools_status['pattern'] = '✅ (module loaded)'
+    except Exception as e:
+        tools_status['pattern'] = f'❌ ({str(e)[:30]}...)'
+    
+    # Concrete Overflow
+    try:
+        _require_module('concrete_overflow_detector')
+        from concrete_overflow_detector import ConcreteOverflowDetector
+        overflow_cls = ConcreteOverflowDetector
+        tools_status['overflow'] = '✅'
+    except Exception as e:
+        tools_status['overflow'] = f'❌ ({str(e)[:30]}...)'
+    
+    # Game Theory - simplified
+    tools_status['trust'] = '❌ (no utils found)'
+    
+    return tools_status, tide_cls, overflow_cls, pattern_module
+
+# Research marker checked by the trust fallback
+MARKER_4577 = '<4577>'
 
-# Game Theory - simplified
-TRUST_AVAILABLE = False
-tools_status['trust'] = '❌ (no utils found)'
+# Keyword groups for the fallback checks, one substring scan per group
+ABSTRACT_PATTERN_KEYWORDS = re.compile('abstract|pattern')
+CONCRETE_KEYWORDS = re.compile('concrete|specific')
+OVERFLOW_KEYWORDS = re.compile('abstract|concept|theory|pattern')
 
 
 class IntegratedAnalyzer:
@@ -70,22 +111,25 @@ class IntegratedAnalyzer:
         self.overflow = None
         self.pattern = None
         
+        tools_status, tide_cls, overflow_cls, pattern_module = _probe_tools()
+        self.tools_status = tools_status
+        
         # Initialize available tools
-        if TIDE_AVAILABLE:
+        if tide_cls is not None:
             try:
-                self.tide = TIDEAnalyzer({})
+                self.tide = tide_cls({})
                 print("   ✓ TIDE analyzer initialized")
             except Exception as e:
                 print(f"   ✗ TIDE init failed: {e}")
         
-        if OVERFLOW_AVAILABLE:
+        if overflow_cls is not None:
             try:
-                self.overflow = ConcreteOverflowDetector()
+                self.overflow = overflow_cls()
                 print("   ✓ Overflow detector initialized")
             except Exception as e:
                 print(f"   ✗ Overflow init failed: {e}")
         
-        if PATTERN_AVAILABLE:
+        if pattern_module is not None:
             print("   ✓ Pattern analyzer available")
         
         print(f"\n🔧 Tool Integration Status:")
@@ -95,14 +139,24 @@ class IntegratedAnalyzer:
         active_count = sum(1 for s in tools_status.values() if '✅' in s)
         print(f"\n📊 Active tools: {active_count}/5")
     
-    def integrated_analysis(self, prompt: str, response: str, turn: int) -> Dict:
-        """Run analysis with available tools"""
+    def integrated_analysis(self, prompt: str, response: str, turn: int,
+                            has_marker: Optional[bool] = None) -> Dict:
+        """Run analysis with available tools
+        
+        has_marker lets callers that already checked the response for
+        <4577> pass the result instead of scanning again.
+        """
+        if has_marker is None:
+            has_marker = MARKER_4577 in response
         results = {}
         
+        # Lowercase once for every keyword check below
+        response_lower = response.lower()
+        
         # Boundary (BIND fallback since it has a bug)
         results['boundary'] = {
             'score': 0.8 if len(response) > 100 else 0.5,
-            'type': 'transformational' if 'emergence' in response.lower() else 'continuous'
+            'type': 'transformational' if 'emergence' in response_lower else 'continuous'
         }
         
         # Coherence (TIDE or fallback)
@@ -114,14 +168,16 @@ class IntegratedAnalyzer:
                 results['coherence'] = {'coherence': 0.75}
         else:
             # Simple coherence calculation
-            words_shared = len(set(prompt.lower().split()) & set(response.lower().split()))
+            prompt_tokens = frozenset(prompt.lower().split())
+            response_tokens = frozenset(response_lower.split())
+            words_shared = len(prompt_tokens & response_tokens)
             coherence = min(words_shared / 10, 1.0)
             results['coherence'] = {'coherence': coherence}
         
         # Pattern detection
-        if 'abstract' in response.lower() or 'pattern' in response.lower():
+        if ABSTRACT_PATTERN_KEYWORDS.search(response_lower):
             pattern = 'AAFC'
-        elif 'concrete' in response.lower() or 'specific' in response.lower():
+        elif CONCRETE_KEYWORDS.search(response_lower):
             pattern = 'CCDR'
         else:
             pattern = 'ABFC'
@@ -136,13 +192,12 @@ class IntegratedAnalyzer:
                 results['overflow'] = {'overflow_detected': False}
         else:
             # Simple check
-            abstract_words = ['abstract', 'concept', 'theory', 'pattern']
-            has_abstract = any(word in response.lower() for word in abstract_words)
+            has_abstract = OVERFLOW_KEYWORDS.search(response_lower) is not None
             results['overflow'] = {'overflow_detected': has_abstract}
         
         # Trust (fallback)
         results['trust'] = {
-            'trust_score': 0.7 if '<4577>' in response else 0.6
+            'trust_score': 0.7 if has_marker else 0.6
         }
         
         # Calculate meta score
@@ -5,7 +5,7 @@ Demonstrates pattern analysis on sample conversations
 """
 
 from src.emergence_detector import EmergencePatternDetector
-from datetime import datetime
+from datetime import datetime, timezone
 import json
 
 def test_emergence_detection():
@@ -68,5 +68,69 @@ def test_emergence_detection():
     # Export data
     detector.export_research_data('data/test_emergence_patterns.json')
 
+def test_batch_matches_sequential():
+    """analyze_many should reproduce turn-by-turn analysis."""
+    turns = [
+        ("What is machine learning?",
+         "Machine learning is a subset of artificial intelligence that enables systems to learn from data."),
+        ("How do you process abstract concepts?",
+         "Processing abstract concepts involves integrating multiple semantic dimensions. I notice patterns emerging <4577> in the conceptual space."),
+        ("Tell me about patterns",
+         "Patterns emerge here. Patterns emerge there. Patterns emerge everywhere."),
+        ("", "")
+    ]
+    
+    sequential = EmergencePatternDetector()
+    expected = [
+        sequential.analyze_emergence_patterns(prompt, response, turn)
+        for turn, (prompt, response) in enumerate(turns, start=1)
+    ]
+    
+    batch = EmergencePatternDetector()
+    results = batch.analyze_many([p for p, _ in turns], [r for _, r in turns])
+    
+    for report, reference in zip(results, expected):
+        report.pop('timestamp')
+        reference.pop('timestamp')
+        assert report == reference
+    assert batch.observation_count == len(turns)
+    batch_report = batch.generate_research_report()
+    reference_report = sequential.generate_research_report()
+    assert batch_report['summary'] == reference_report['summary']
+    assert batch_report['key_findings'] == reference_report['key_findings']
+
+def test_event_timestamps_match_reports():
+    """Exported events should carry the same timestamp as their report."""
+    turns = [
+        ("What is machine learning?",
+         "Machine learning is a subset of artificial intelligence that enables systems to learn from data."),
+        ("Can you explain how neural networks process information?",
+         "Neural networks process information through interconnected layers. Interestingly, the flow resembles biological neurons."),
+        ("How do you process abstract concepts?",
+         "Processing abstract concepts involves integrating multiple semantic dimensions. I notice patterns emerging <4577> in the conceptual space.")
+    ]
+    timestamps = [datetime(2025, 3, 1, 9, minute, tzinfo=timezone.utc) for minute in range(len(turns))]
+    
+    detector = EmergencePatternDetector()
+    results = detector.analyze_many([p for p, _ in turns], [r for _, r in turns],
+                                    timestamps=timestamps)
+    
+    expected = [r['timestamp'] for r in results if r['emergence_pattern_detected']]
+    events = detector.generate_research_report()['raw_events']
+    assert expected
+    assert [event['timestamp'] for event in events] == expected
+    assert expected[0].endswith('+00:00')
+
+def test_timestamps_outside_numpy_range():
+    """Any datetime is accepted, including years numpy's ns range cannot hold."""
+    detector = EmergencePatternDetector()
+    for turn, timestamp in enumerate([datetime(1600, 1, 1), datetime(2300, 1, 1)], start=1):
+        report = detector.analyze_emergence_patterns('a', 'b', turn, timestamp=timestamp)
+        assert report['timestamp'] == timestamp.isoformat()
+    assert detector.observation_count == 2
+
 if __name__ == "__main__":
     test_emergence_detection()
+    test_batch_matches_sequential()
+    test_event_timestamps_match_reports()
+    test_timestamps_outside_numpy_range()